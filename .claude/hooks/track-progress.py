@@ -3,7 +3,7 @@
 Claude Code Task Progress Tracker Hook
 
 This hook tracks Claude Code session progress and writes events to a JSONL file
-that can be consumed by wtenv UI for real-time task monitoring.
+that can be consumed by ccmon UI for real-time task monitoring.
 
 Events tracked:
 - SessionStart: Task initialization → (no status)
@@ -11,7 +11,7 @@ Events tracked:
 - PostToolUse: Progress updates on tool execution → in_progress (or error)
 - Stop: Response completed, user action needed → stop
 - SessionEnd: Session ended → session_ended
-- Notification: Permission or input needed → stop
+- Notification: Permission or input needed → stop (other notifications are not recorded)
 
 Status mapping:
 - in_progress: Claude is actively working
@@ -20,22 +20,117 @@ Status mapping:
 - error: Tool execution failed
 
 Output format: ~/.claude/task-progress/<session_id>.jsonl
+Errors are logged as JSONL to ~/.claude/task-progress/errors.log
 
-Security: All log files are created with 0o600 permissions (user read/write only)
+Security: All log files are created with 0o600 permissions (user read/write only),
+set atomically at creation time; the progress directory is created with 0o700
 """
 
-import json
 import sys
 import os
-import traceback
-from pathlib import Path
-from datetime import datetime
+from os.path import basename
+from time import time_ns, gmtime, strftime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def get_task_status(hook_event: str, tool_name: str = "", hook_data: dict = None) -> str:
+# Resolved once per process; the hook runs on every event
+PROGRESS_DIR = os.path.join(os.path.expanduser("~"), ".claude", "task-progress")
+
+
+# Events consumed by the UI; anything else is ignored before touching disk
+_TRACKED_EVENTS = frozenset({
+    "SessionStart",
+    "UserPromptSubmit",
+    "PostToolUse",
+    "Stop",
+    "SessionEnd",
+    "Notification",
+})
+
+
+# Context message shown to Claude on SessionStart, pre-encoded for stdout
+_INIT_MESSAGE = "✓ Task progress tracking initialized for ccmon UI".encode("utf-8")
+
+
+def ensure_progress_dir() -> None:
+    """Create the progress directory unless it already exists."""
+    if not os.path.isdir(PROGRESS_DIR):
+        os.makedirs(PROGRESS_DIR, exist_ok=True)
+
+
+def utc_timestamp() -> str:
+    """Return the current UTC time as an ISO 8601 string with microseconds and "Z"."""
+    seconds, nanos = divmod(time_ns(), 1_000_000_000)
+    return strftime("%Y-%m-%dT%H:%M:%S", gmtime(seconds)) + ".%06dZ" % (nanos // 1000)
+
+
+if orjson is not None:
+    def decode_hook_input(raw: bytes) -> dict:
+        """Parse the raw hook payload read from stdin."""
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects lone surrogate escapes that the stdlib accepts
+            import json
+            return json.loads(raw.decode("utf-8"))
+
+    def encode_record(record: dict) -> bytes:
+        """Serialize record as one UTF-8 encoded JSONL line."""
+        try:
+            return orjson.dumps(record) + b"\n"
+        except orjson.JSONEncodeError:
+            # orjson rejects lone surrogates; the stdlib escapes them instead
+            import json
+            return (json.dumps(record, separators=(",", ":")) + "\n").encode("ascii")
+else:
+    import json
+
+    _json_decode = json.JSONDecoder().decode
+    _json_dumps = json.dumps
+
+    def decode_hook_input(raw: bytes) -> dict:
+        """Parse the raw hook payload read from stdin."""
+        return _json_decode(raw.decode("utf-8"))
+
+    def encode_record(record: dict) -> bytes:
+        """Serialize record as one ASCII-only JSONL line."""
+        # ensure_ascii keeps lone surrogates as escapes, so encoding can't fail
+        return (_json_dumps(record, separators=(",", ":")) + "\n").encode("ascii")
+
+
+def append_bytes(path: str, payload: bytes) -> None:
+    """Append payload to path in one O_APPEND write; new files get 0o600."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
+
+
+def _tool_failed(tool_name: str, tool_result) -> bool:
+    """Return True if a PostToolUse result reports an error."""
+    if isinstance(tool_result, str):
+        # Generic tool errors
+        return "error" in tool_result.lower()
+    # Bash tool errors; the tool name check is cheaper than isinstance
+    return tool_name == "Bash" and isinstance(tool_result, dict) and bool(tool_result.get("error"))
+
+
+def get_task_status(
+    hook_event: str,
+    tool_name: str = "",
+    notification: str = "",
+    tool_result=None,
+) -> str:
     """
     Determine task status based on hook event and tool name.
 
+    notification is the Notification event's message; tool_result is the
+    PostToolUse result (dict or str).
+
     Returns: "in_progress" | "stop" | "session_ended" | "error" | None
     """
     if hook_event == "SessionStart":
@@ -52,90 +147,125 @@ def get_task_status(hook_event: str, tool_name: str = "", hook_data: dict = None
         return "session_ended"
     elif hook_event == "Notification":
         # Permission or input needed
-        if hook_data:
-            message = hook_data.get("message", "").lower()
-            # "Claude needs permission" or "waiting for input"
-            if "permission" in message or "waiting" in message or "input" in message:
-                return "stop"
+        message = notification.lower()
+        # "Claude needs permission" or "waiting for input"
+        if "permission" in message or "waiting" in message or "input" in message:
+            return "stop"
         return None  # Other notifications don't change status
     elif hook_event == "PostToolUse":
         # Check for tool errors
-        if hook_data:
-            tool_result = hook_data.get("tool_result", {})
-            # Bash tool errors
-            if tool_name == "Bash" and isinstance(tool_result, dict):
-                error = tool_result.get("error")
-                if error:
-                    return "error"
-            # Generic tool errors
-            if isinstance(tool_result, str) and "error" in tool_result.lower():
-                return "error"
-        return "in_progress"
+        return "error" if _tool_failed(tool_name, tool_result) else "in_progress"
     else:
         return "in_progress"
 
 
-def get_event_message(hook_data: dict) -> str:
+# Trailing separators and "." components are ignored like Path(...).name does
+_PATH_SEPARATORS = os.sep + (os.altsep or "")
+_CURDIR_SUFFIXES = tuple(sep + "." for sep in _PATH_SEPARATORS)
+
+
+def _file_name(tool_input: dict) -> str:
+    """Return the base name of tool_input["file_path"], or "unknown"."""
+    file_path = tool_input.get("file_path") or ""
+    if not file_path:
+        return "unknown"
+    path = file_path.rstrip(_PATH_SEPARATORS)
+    while path.endswith(_CURDIR_SUFFIXES):
+        path = path[:-2].rstrip(_PATH_SEPARATORS)
+    name = basename(path)
+    return name if name and name != "." else "unknown"
+
+
+def _write_message(tool_input: dict) -> str:
+    return f"Created file: {_file_name(tool_input)}"
+
+
+def _edit_message(tool_input: dict) -> str:
+    return f"Edited file: {_file_name(tool_input)}"
+
+
+def _bash_message(tool_input: dict) -> str:
+    command = tool_input.get("command", "")
+    # Truncate long commands; a non-empty command[50:51] means it was cut
+    return f"Executed: {command[:50]}{'...' if command[50:51] else ''}"
+
+
+def _read_message(tool_input: dict) -> str:
+    return f"Read file: {_file_name(tool_input)}"
+
+
+# Fixed messages for events that don't depend on tool input
+_EVENT_MESSAGES = {
+    "SessionStart": "Session started",
+    "UserPromptSubmit": "Processing user prompt",
+    "SessionEnd": "Session completed",
+    "Stop": "Waiting for user response",
+}
+
+# PostToolUse message formatters keyed by tool name
+_TOOL_FORMATTERS = {
+    "Write": _write_message,
+    "Edit": _edit_message,
+    "Bash": _bash_message,
+    "Read": _read_message,
+}
+
+
+def get_event_message(event: str, tool: str = "", tool_input: dict = None) -> str:
     """Generate a human-readable message for the event."""
-    event = hook_data.get("hook_event_name", "")
-    tool = hook_data.get("tool_name", "")
-
-    if event == "SessionStart":
-        return "Session started"
-    elif event == "UserPromptSubmit":
-        return "Processing user prompt"
-    elif event == "SessionEnd":
-        return "Session completed"
-    elif event == "Stop":
-        return "Waiting for user response"
-    elif event == "PostToolUse":
-        tool_input = hook_data.get("tool_input", {})
+    message = _EVENT_MESSAGES.get(event)
+    if message is not None:
+        return message
 
-        if tool == "Write":
-            file_path = tool_input.get("file_path", "")
-            return f"Created file: {Path(file_path).name if file_path else 'unknown'}"
-        elif tool == "Edit":
-            file_path = tool_input.get("file_path", "")
-            return f"Edited file: {Path(file_path).name if file_path else 'unknown'}"
-        elif tool == "Bash":
-            command = tool_input.get("command", "")
-            # Truncate long commands
-            cmd_preview = command[:50] + "..." if len(command) > 50 else command
-            return f"Executed: {cmd_preview}"
-        elif tool == "Read":
-            file_path = tool_input.get("file_path", "")
-            return f"Read file: {Path(file_path).name if file_path else 'unknown'}"
-        else:
+    if event == "PostToolUse":
+        formatter = _TOOL_FORMATTERS.get(tool)
+        if formatter is None:
             return f"Used tool: {tool}"
+        return formatter(tool_input or {})
 
     return "Unknown event"
 
 
 def main():
     """Main hook execution."""
+    # Anything this process creates is private to the user: the progress
+    # directory gets 0o700 and log files keep the 0o600 passed to os.open
+    os.umask(0o077)
+
     try:
         # Read JSON input from stdin
-        hook_data = json.load(sys.stdin)
+        hook_data = decode_hook_input(sys.stdin.buffer.read())
 
         session_id = hook_data.get("session_id", "unknown")
         hook_event = hook_data.get("hook_event_name", "")
         tool_name = hook_data.get("tool_name", "")
         cwd = hook_data.get("cwd", "")
+        tool_input = hook_data.get("tool_input", {})
+        tool_result = hook_data.get("tool_result", {})
+        notification = hook_data.get("message", "")
+
+        # Skip events the UI doesn't consume before any filesystem work
+        if hook_event not in _TRACKED_EVENTS:
+            return
+
+        # Determine task status (with error detection)
+        status = get_task_status(hook_event, tool_name, notification, tool_result)
+
+        # Notifications only matter when they ask for user action
+        if hook_event == "Notification" and status is None:
+            return
+
+        message = get_event_message(hook_event, tool_name, tool_input)
 
         # Create progress directory
-        progress_dir = Path.home() / ".claude" / "task-progress"
-        progress_dir.mkdir(parents=True, exist_ok=True)
+        ensure_progress_dir()
 
         # Session-specific progress file
-        progress_file = progress_dir / f"{session_id}.jsonl"
-
-        # Determine task status (with error detection)
-        status = get_task_status(hook_event, tool_name, hook_data)
-        message = get_event_message(hook_data)
+        progress_file = os.path.join(PROGRESS_DIR, f"{session_id}.jsonl")
 
         # Create event record
         event_record = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": utc_timestamp(),
             "session_id": session_id,
             "event": hook_event,
             "tool": tool_name if tool_name else None,
@@ -148,36 +278,29 @@ def main():
             event_record["status"] = status
 
         # Append to JSONL file with secure permissions (0o600)
-        file_exists = progress_file.exists()
-        with open(progress_file, "a") as f:
-            json.dump(event_record, f)
-            f.write("\n")
-
-        # Set secure permissions on new files (user read/write only)
-        if not file_exists:
-            os.chmod(progress_file, 0o600)
+        append_bytes(progress_file, encode_record(event_record))
 
         # For SessionStart, output context message to Claude
         if hook_event == "SessionStart":
-            sys.stdout.write("✓ Task progress tracking initialized for wtenv UI")
+            sys.stdout.buffer.write(_INIT_MESSAGE)
+            sys.stdout.buffer.flush()
 
     except Exception as e:
         # Log errors with full traceback but don't fail the hook
-        error_log = Path.home() / ".claude" / "task-progress" / "errors.log"
-        error_log.parent.mkdir(parents=True, exist_ok=True)
-
-        # Set secure permissions on error log
-        file_exists = error_log.exists()
-        with open(error_log, "a") as f:
-            f.write(f"\n{'='*60}\n")
-            f.write(f"Time: {datetime.utcnow().isoformat()}Z\n")
-            f.write(f"Error: {str(e)}\n")
-            f.write(f"Traceback:\n")
-            f.write(traceback.format_exc())
-            f.write(f"{'='*60}\n")
-
-        if not file_exists:
-            os.chmod(error_log, 0o600)
+        # Imported here so the success path doesn't pay for it
+        import traceback
+
+        ensure_progress_dir()
+        error_log = os.path.join(PROGRESS_DIR, "errors.log")
+
+        # One JSONL record per failure, same format as the progress files
+        error_record = {
+            "timestamp": utc_timestamp(),
+            "level": "error",
+            "error": str(e),
+            "traceback": traceback.format_exc(),
+        }
+        append_bytes(error_log, encode_record(error_record))
 
 
 if __name__ == "__main__":
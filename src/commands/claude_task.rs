@@ -3,6 +3,7 @@ use chrono::{DateTime, Utc};
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
 use std::fs;
+use std::io::{Read, Seek, SeekFrom};
 use std::path::{Path, PathBuf};
 use std::process::Command;
 use std::time::SystemTime;
@@ -285,6 +286,15 @@ impl ClaudeTask {
     }
 }
 
+/// How far a session file has been parsed
+#[derive(Debug, Clone, Copy, Default, PartialEq, Eq)]
+struct FilePosition {
+    /// Byte offset just past the last consumed line
+    offset: u64,
+    /// Number of lines consumed so far
+    line: usize,
+}
+
 /// Manager for multiple Claude Code task sessions
 #[derive(Debug, Default)]
 #[allow(dead_code)]
@@ -293,6 +303,8 @@ pub struct TaskManager {
     tasks: HashMap<String, ClaudeTask>,
     /// File modification times for caching
     file_mtimes: HashMap<PathBuf, SystemTime>,
+    /// Position up to which each file has been parsed
+    file_positions: HashMap<PathBuf, FilePosition>,
 }
 
 #[allow(dead_code)]
@@ -302,6 +314,7 @@ impl TaskManager {
         Self {
             tasks: HashMap::new(),
             file_mtimes: HashMap::new(),
+            file_positions: HashMap::new(),
         }
     }
 
@@ -333,8 +346,11 @@ impl TaskManager {
                 }
             }
 
-            if let Err(e) = manager.load_session_file(&path) {
-                eprintln!("Warning: Failed to load {}: {}", path.display(), e);
+            match manager.load_session_file_from(&path, FilePosition::default()) {
+                Ok(position) => {
+                    manager.file_positions.insert(path, position);
+                }
+                Err(e) => eprintln!("Warning: Failed to load {}: {}", path.display(), e),
             }
         }
 
@@ -343,13 +359,36 @@ impl TaskManager {
 
     /// Load a single session file
     fn load_session_file(&mut self, path: &Path) -> Result<()> {
-        let content = fs::read_to_string(path)
+        self.load_session_file_from(path, FilePosition::default())
+            .map(|_| ())
+    }
+
+    /// Load events from a session file starting at `start`
+    /// Returns the position just past the last consumed line, so the next call
+    /// only parses what the hook appended in the meantime
+    fn load_session_file_from(&mut self, path: &Path, start: FilePosition) -> Result<FilePosition> {
+        let mut file = fs::File::open(path)
             .with_context(|| format!("Failed to read file: {}", path.display()))?;
+        file.seek(SeekFrom::Start(start.offset))
+            .with_context(|| format!("Failed to read file: {}", path.display()))?;
+        let mut buf = Vec::new();
+        file.read_to_end(&mut buf)
+            .with_context(|| format!("Failed to read file: {}", path.display()))?;
+
+        // Only consume complete lines; a trailing partial line is kept for the
+        // next call unless it already parses (e.g. a file without final newline)
+        let mut consumed = buf.iter().rposition(|&b| b == b'\n').map_or(0, |i| i + 1);
+        if consumed < buf.len() && serde_json::from_slice::<TaskEvent>(&buf[consumed..]).is_ok() {
+            consumed = buf.len();
+        }
+        let content = String::from_utf8_lossy(&buf[..consumed]);
 
         let mut valid_events = 0;
         let mut parse_errors = 0;
+        let mut line_num = start.line;
 
-        for (line_num, line) in content.lines().enumerate() {
+        for line in content.lines() {
+            line_num += 1;
             if line.trim().is_empty() {
                 continue;
             }
@@ -365,7 +404,7 @@ impl TaskManager {
                     eprintln!(
                         "⚠️  Warning: Skipping invalid line in {}:{}: {}",
                         path.display(),
-                        line_num + 1,
+                        line_num,
                         e
                     );
                     // Continue processing remaining lines
@@ -382,7 +421,10 @@ impl TaskManager {
             );
         }
 
-        Ok(())
+        Ok(FilePosition {
+            offset: start.offset + consumed as u64,
+            line: line_num,
+        })
     }
 
     /// Add an event to the appropriate task
@@ -472,7 +514,11 @@ impl TaskManager {
             }
 
             // Check if file has been modified since last load
-            let current_mtime = match fs::metadata(&path).and_then(|m| m.modified()) {
+            let metadata = match fs::metadata(&path) {
+                Ok(metadata) => metadata,
+                Err(_) => continue,
+            };
+            let current_mtime = match metadata.modified() {
                 Ok(mtime) => mtime,
                 Err(_) => continue,
             };
@@ -483,17 +529,31 @@ impl TaskManager {
             };
 
             if should_reload {
-                // Remove old events for this session before reloading
-                if let Some(session_id) = path
-                    .file_stem()
-                    .and_then(|s| s.to_str())
-                    .map(|s| s.to_string())
-                {
-                    self.tasks.remove(&session_id);
-                }
+                // Session files are append-only, so a file that hasn't shrunk
+                // only needs its new tail parsed
+                let start = match self.file_positions.get(&path) {
+                    Some(&position) if position.offset <= metadata.len() => position,
+                    _ => {
+                        // Remove old events for this session before reloading
+                        if let Some(session_id) = path
+                            .file_stem()
+                            .and_then(|s| s.to_str())
+                            .map(|s| s.to_string())
+                        {
+                            self.tasks.remove(&session_id);
+                        }
+                        FilePosition::default()
+                    }
+                };
 
-                if let Err(e) = self.load_session_file(&path) {
-                    eprintln!("Warning: Failed to reload {}: {}", path.display(), e);
+                match self.load_session_file_from(&path, start) {
+                    Ok(position) => {
+                        self.file_positions.insert(path.clone(), position);
+                    }
+                    Err(e) => {
+                        self.file_positions.remove(&path);
+                        eprintln!("Warning: Failed to reload {}: {}", path.display(), e);
+                    }
                 }
 
                 self.file_mtimes.insert(path, current_mtime);
@@ -698,6 +758,43 @@ mod tests {
         Ok(())
     }
 
+    #[test]
+    fn test_load_session_file_from_offset() -> Result<()> {
+        let temp_dir = TempDir::new()?;
+        let file_path = temp_dir.path().join("incremental.jsonl");
+
+        let mut file = fs::File::create(&file_path)?;
+        writeln!(
+            file,
+            r#"{{"timestamp":"2025-12-30T10:00:00Z","session_id":"test","event":"SessionStart","tool":null,"message":"Started","cwd":"/tmp"}}"#
+        )?;
+
+        let mut manager = TaskManager::new();
+        let position = manager.load_session_file_from(&file_path, FilePosition::default())?;
+        assert_eq!(position.offset, fs::metadata(&file_path)?.len());
+        assert_eq!(position.line, 1);
+
+        // Append a complete line plus a partial one still being written
+        writeln!(
+            file,
+            r#"{{"timestamp":"2025-12-30T10:01:00Z","session_id":"test","event":"Stop","tool":null,"status":"stop","message":"Waiting","cwd":"/tmp"}}"#
+        )?;
+        let complete_len = fs::metadata(&file_path)?.len();
+        write!(file, r#"{{"timestamp":"2025-12-30T10:02:00Z""#)?;
+
+        // Only the new complete line is parsed; the partial line is left for later
+        let position = manager.load_session_file_from(&file_path, position)?;
+        assert_eq!(position.offset, complete_len);
+        // Line numbers keep counting from the start of the file
+        assert_eq!(position.line, 2);
+
+        let task = manager.get_task("test").unwrap();
+        assert_eq!(task.events.len(), 2);
+        assert_eq!(task.status, TaskStatus::Stop);
+
+        Ok(())
+    }
+
     #[test]
     fn test_empty_session_file() -> Result<()> {
         let temp_dir = TempDir::new()?;